@@ -6,6 +6,7 @@ import shutil
 import os
 import pty
 import select
+from operator import itemgetter
 
 def log_debug(msg):
     print(f"[DEBUG-BT] {msg}", flush=True)
@@ -112,12 +113,13 @@ def get_bluetooth_devices():
 def _deduplicate(devices):
     unique_devs = {}
     for d in devices:
+        d['type'] = 'bluetooth'
         mac = d['mac']
         # Keep strongest signal
         if mac not in unique_devs or d.get('rssi', -100) > unique_devs[mac].get('rssi', -100):
             unique_devs[mac] = d
     # Sort by strength
-    return sorted(list(unique_devs.values()), key=lambda x: x['rssi'], reverse=True)
+    return sorted(unique_devs.values(), key=itemgetter('rssi'), reverse=True)
 
 if __name__ == "__main__":
     print("Scanning for Bluetooth devices...")
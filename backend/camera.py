@@ -7,6 +7,14 @@ import threading
 import requests
 from abc import ABC, abstractmethod
 
+# Multipart framing for every MJPEG endpoint, pre-encoded once
+MJPEG_FRAME_HEADER = b'--frame\r\nContent-Type: image/jpeg\r\n\r\n'
+MJPEG_FRAME_TRAILER = b'\r\n'
+
+def mjpeg_part(jpeg) -> bytes:
+    """Wrap one JPEG (bytes or a cv2.imencode buffer) in its multipart boundary with a single allocation."""
+    return b''.join((MJPEG_FRAME_HEADER, jpeg, MJPEG_FRAME_TRAILER))
+
 class BaseCamera(ABC):
     @abstractmethod
     async def get_frame(self):
@@ -85,11 +93,40 @@ def get_camera(type='rgb'):
         camera_instance = StreamProxyCamera()
     return camera_instance
 
+def read_stream_jpeg(stream_url, timeout=3, max_bytes=2_000_000):
+    """
+    Returns the first complete JPEG from an MJPEG stream, exactly as the camera encoded it.
+    On the Pi the stream comes from the hardware encoder, so no CPU encode is needed.
+    """
+    with requests.get(stream_url, stream=True, timeout=timeout) as r:
+        if r.status_code != 200:
+            print(f"Camera returned status: {r.status_code}")
+            return None
+        buf = bytearray()
+        for chunk in r.iter_content(chunk_size=16384):
+            buf += chunk
+            a = buf.find(b'\xff\xd8')
+            if a != -1:
+                b = buf.find(b'\xff\xd9', a + 2)
+                if b != -1:
+                    return bytes(buf[a:b+2])
+            if len(buf) > max_bytes:
+                return None
+    return None
+
 def capture_fresh_frame(stream_url="http://127.0.0.1:8080/mjpeg"):
     """
     Connects to the stream, grabs one frame cleanly, and returns JPEG bytes.
-    Uses OpenCV which handles buffering/sync better than raw sockets.
+    Passes the stream's own JPEG through untouched; falls back to an OpenCV
+    decode + re-encode only if no JPEG could be pulled out of the stream.
     """
+    try:
+        frame_bytes = read_stream_jpeg(stream_url)
+        if frame_bytes:
+            return frame_bytes
+    except Exception as e:
+        print(f"Direct JPEG capture failed, falling back to OpenCV: {e}")
+
     try:
         cap = cv2.VideoCapture(stream_url)
         if not cap.isOpened():
@@ -352,10 +389,7 @@ async def generate_rgb_stream():
         # Only send if we have a NEW frame.
         if frame and current_id != last_frame_id:
             last_frame_id = current_id
-            yield (
-                b'--frame\r\n'
-                b'Content-Type: image/jpeg\r\n\r\n' + frame + b'\r\n'
-            )
+            yield mjpeg_part(frame)
         else:
             # If no new frame, just sleep a tiny bit to prevent CPU burn
             await asyncio.sleep(0.005)
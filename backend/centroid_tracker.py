@@ -1,6 +1,9 @@
 from collections import OrderedDict
+import logging
 import numpy as np
 
+logger = logging.getLogger(__name__)
+
 class CentroidTracker:
     def __init__(self, max_disappeared=10, max_distance=50, probation_frames=5):
         self.next_object_id = 0
@@ -15,7 +18,7 @@ class CentroidTracker:
         self.objects[self.next_object_id] = centroid
         self.disappeared[self.next_object_id] = 0
         self.persistence[self.next_object_id] = 0  # Start at 0, confirming at N
-        print(f"[TRACKER] Registered NEW ID {self.next_object_id}", flush=True)
+        logger.debug("Registered NEW ID %d", self.next_object_id)
         self.next_object_id += 1
 
     def deregister(self, object_id):
@@ -72,7 +75,7 @@ class CentroidTracker:
                 self.objects[object_id] = input_centroids[col]
                 self.disappeared[object_id] = 0
                 self.persistence[object_id] += 1  # Increment frame count
-                print(f"[TRACKER] Matched ID {object_id} -> Persistence {self.persistence[object_id]}", flush=True)
+                logger.debug("Matched ID %d -> Persistence %d", object_id, self.persistence[object_id])
 
                 used_rows.add(row)
                 used_cols.add(col)
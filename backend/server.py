@@ -1,5 +1,5 @@
 from fastapi import FastAPI, APIRouter, HTTPException, Depends, WebSocket, WebSocketDisconnect
-from fastapi.responses import StreamingResponse, FileResponse, JSONResponse
+from fastapi.responses import StreamingResponse, FileResponse, JSONResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from dotenv import load_dotenv
@@ -8,12 +8,15 @@ import os
 import logging
 import asyncio
 import time
-import glob
+import hashlib
 import cv2
 import numpy as np
 from pathlib import Path
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from typing import List, Optional, Set
+from collections import deque
+from contextlib import suppress
+from concurrent.futures import ThreadPoolExecutor
 import uuid
 from datetime import datetime, timedelta
 from enum import Enum
@@ -27,10 +30,11 @@ from jose import JWTError, jwt
 from passlib.context import CryptContext
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
-from sqlalchemy import Column, String, Boolean, DateTime, CheckConstraint, select, Float, Integer, text
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy import Column, String, Boolean, DateTime, CheckConstraint, select, insert, update, delete, bindparam, Float, Integer, text, event
 import thermal_pipeline
 from datetime import datetime, timedelta, timezone
-import json
+import orjson
 
 
 # IST Timezone (UTC + 5:30)
@@ -39,8 +43,8 @@ IST_OFFSET = timezone(timedelta(hours=5, minutes=30))
 def get_ist_time():
     return datetime.now(IST_OFFSET)
 # Global Signal Cache (Zero-Lag)
+# The scanner builds a new list and rebinds the name, so readers always see a complete snapshot without a lock
 signal_cache = []
-signal_cache_lock = None # Initialized in startup()
 
 # Setup
 ROOT_DIR = Path(__file__).parent
@@ -55,15 +59,55 @@ logger = logging.getLogger(__name__)
 
 # Security Config
 SECRET_KEY = os.environ.get("SECRET_KEY", "resofly_secret_key_12345")
+# Comma-separated; "CORS_ORIGINS=http://a, http://b" tolerates spaces and stray commas
+CORS_ORIGINS = [o.strip() for o in os.environ.get('CORS_ORIGINS', '*').split(',') if o.strip()] or ['*']
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7 # 7 Days
 
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+# Argon2 is much cheaper than pbkdf2 on the Pi's ARM cores at equivalent strength. Use it when
+# argon2-cffi is installed; pbkdf2_sha256 stays in the list so existing hashes still verify and
+# get rehashed on the next successful login. PBKDF2_ROUNDS tunes the fallback hasher.
+try:
+    import argon2  # noqa: F401
+    PASSWORD_SCHEMES = ["argon2", "pbkdf2_sha256"]
+except ImportError:
+    PASSWORD_SCHEMES = ["pbkdf2_sha256"]
+
+pwd_context = CryptContext(
+    schemes=PASSWORD_SCHEMES,
+    deprecated="auto",
+    argon2__time_cost=2,
+    argon2__memory_cost=19456,
+    argon2__parallelism=1,
+    pbkdf2_sha256__rounds=int(os.environ.get("PBKDF2_ROUNDS", 29000)),
+)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/token")
 
 # Database Setup
 DATABASE_URL = "sqlite+aiosqlite:///./thermo_vision.db"
-engine = create_async_engine(DATABASE_URL, echo=True)
+# Set SQL_ECHO=1 to log every statement while debugging.
+# aiosqlite defaults to NullPool (a new connection + thread per session); pool them instead
+# so each connection's page cache and pragmas survive across requests. Sessions never share
+# a connection, unlike StaticPool, so concurrent transactions stay isolated.
+engine = create_async_engine(
+    DATABASE_URL,
+    echo=os.environ.get("SQL_ECHO") == "1",
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=5,
+    max_overflow=10,
+)
+
+@event.listens_for(engine.sync_engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    # WAL lets API reads run while detections are written; NORMAL skips the per-commit fsync
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-64000")  # 64 MB page cache
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB memory-mapped reads
+    cursor.close()
+
 AsyncSessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 Base = declarative_base()
 
@@ -84,7 +128,7 @@ class AlertDB(Base):
     type = Column(String)
     title = Column(String)
     message = Column(String)
-    timestamp = Column(DateTime, default=get_ist_time)
+    timestamp = Column(DateTime, default=get_ist_time, index=True)
     acknowledged = Column(Boolean, default=False)
     # New Detection Fields
     lat = Column(Float, default=0.0)
@@ -131,8 +175,7 @@ class Alert(AlertBase):
     lon: float
     confidence: float
     max_temp: float
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class StatusCheckCreate(BaseModel):
     client_name: str
@@ -141,8 +184,7 @@ class StatusCheck(BaseModel):
     id: str
     client_name: str
     timestamp: datetime
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class GPSData(BaseModel):
     latitude: float
@@ -164,6 +206,36 @@ class SystemStatus(BaseModel):
     boot_time_str: str
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
+# List endpoints validate and serialize through these prebuilt adapters, then return a ready
+# Response so FastAPI skips its own per-row response_model pass and jsonable_encoder walk.
+# response_model stays on the routes for the OpenAPI schema.
+ALERT_LIST_ADAPTER = TypeAdapter(List[Alert])
+STATUS_CHECK_LIST_ADAPTER = TypeAdapter(List[StatusCheck])
+
+def json_list_response(adapter: TypeAdapter, items) -> Response:
+    return Response(
+        content=adapter.dump_json(adapter.validate_python(items, from_attributes=True)),
+        media_type="application/json",
+    )
+
+# --------------------------
+# Prepared Queries
+# --------------------------
+# Built once so SQLAlchemy's compiled-statement cache hits on every request
+SELECT_USER_BY_NAME = select(UserDB).where(UserDB.username == bindparam("username"))
+ACKNOWLEDGE_ALERT_BY_ID = (
+    update(AlertDB)
+    .where(AlertDB.id == bindparam("alert_id"))
+    .values(acknowledged=True)
+    .returning(AlertDB)
+)
+# Column-only: the list endpoint is read-only, so skip ORM hydration and the identity map
+SELECT_LATEST_ALERTS = select(
+    AlertDB.id, AlertDB.type, AlertDB.title, AlertDB.message, AlertDB.timestamp,
+    AlertDB.acknowledged, AlertDB.lat, AlertDB.lon, AlertDB.confidence, AlertDB.max_temp,
+).order_by(AlertDB.timestamp.desc()).limit(50)
+SELECT_STATUS_CHECKS = select(StatusCheckDB).limit(100)
+
 # --------------------------
 # Auth Utils & Dependencies
 # --------------------------
@@ -174,6 +246,28 @@ def verify_password(plain_password, hashed_password):
 def get_password_hash(password):
     return pwd_context.hash(password)
 
+# Recent verification results: (username, sha256(password), stored hash) -> (expiry, valid)
+# Keying on the stored hash means a password change never hits a stale entry
+LOGIN_CACHE_TTL = 300
+LOGIN_CACHE_MAX = 128
+login_verify_cache = {}
+
+async def verify_password_cached(username: str, plain_password: str, hashed_password: str) -> bool:
+    key = (username, hashlib.sha256(plain_password.encode()).digest(), hashed_password)
+    now = time.monotonic()
+    entry = login_verify_cache.get(key)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+
+    # pbkdf2 is CPU-bound; keep it off the event loop so streams stay responsive
+    loop = asyncio.get_running_loop()
+    valid = await loop.run_in_executor(None, verify_password, plain_password, hashed_password)
+
+    if len(login_verify_cache) >= LOGIN_CACHE_MAX:
+        login_verify_cache.pop(next(iter(login_verify_cache)))  # Oldest entry first
+    login_verify_cache[key] = (now + LOGIN_CACHE_TTL, valid)
+    return valid
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
@@ -184,29 +278,47 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
-async def get_db():
-    async with AsyncSessionLocal() as session:
-        yield session
+# Decoded tokens, least recently used first: blake2b(token) -> (User, exp). Clients replay
+# the same 7-day token on every poll, so this skips the HMAC check + JSON parse
+JWT_CACHE_MAX = 256
+jwt_decode_cache = {}
+
+def decode_access_token(token: str) -> Optional[User]:
+    """Return the user described by the token's claims, or None if it is invalid or expired."""
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    entry = jwt_decode_cache.pop(key, None)
+    if entry is not None and entry[1] > time.time():
+        jwt_decode_cache[key] = entry  # Re-insert as most recently used
+        return entry[0]
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)):
-    credentials_exception = HTTPException(
-        status_code=401,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
-            raise credentials_exception
     except JWTError:
-        raise credentials_exception
-    
-    result = await db.execute(select(UserDB).where(UserDB.username == username))
-    user = result.scalar_one_or_none()
-    
-    if user is None:
-        raise credentials_exception
+        return None
+    username = payload.get("sub")
+    if username is None:
+        return None
+    # Tokens issued before the "active" claim existed were only handed to active users
+    user = User(username=username, is_active=payload.get("active", True))
+
+    if len(jwt_decode_cache) >= JWT_CACHE_MAX:
+        jwt_decode_cache.pop(next(iter(jwt_decode_cache)))  # Least recently used
+    jwt_decode_cache[key] = (user, payload.get("exp", 0))
+    return user
+
+async def get_db():
+    async with AsyncSessionLocal() as session:
+        yield session
+
+async def get_current_user(token: str = Depends(oauth2_scheme)):
+    """Trust the signed token claims instead of loading the user row on every request."""
+    user = decode_access_token(token)
+    if user is None or not user.is_active:
+        raise HTTPException(
+            status_code=401,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     return user
 
 # --------------------------
@@ -222,53 +334,63 @@ async def root():
 @api_router.post("/token", response_model=None)
 async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_db)):
     try:
-        print(f"Attempting login for user: {form_data.username}")
-        # DEBUG: Print everything
-        print(f"Password provided: {form_data.password}")
+        logger.debug("Attempting login for user: %s", form_data.username)
         
-        result = await db.execute(select(UserDB).where(UserDB.username == form_data.username))
+        result = await db.execute(SELECT_USER_BY_NAME, {"username": form_data.username})
         user = result.scalar_one_or_none()
         
         if not user:
-            print(f"User {form_data.username} not found")
+            logger.debug("User %s not found", form_data.username)
             return JSONResponse(status_code=401, content={"detail": "Incorrect username or password"})
-            
-        print(f"User found. ID: {user.username}. Hash: {user.hashed_password}")
         
         try:
-            valid = verify_password(form_data.password, user.hashed_password)
+            valid = await verify_password_cached(form_data.username, form_data.password, user.hashed_password)
         except Exception as e:
-            print(f"HASH VERIFICATION CRASHED: {e}")
+            logger.error("Hash verification crashed: %s", e)
             return JSONResponse(status_code=500, content={"detail": f"Hash crash: {str(e)}"})
 
         if not valid:
-            print("Password verification failed")
+            logger.debug("Password verification failed for user: %s", form_data.username)
             return JSONResponse(status_code=401, content={"detail": "Incorrect username or password"})
         
-        print("Login successful. Generating token...")
+        if pwd_context.needs_update(user.hashed_password):
+            # Old scheme or round count: rehash once now that we know the plaintext
+            loop = asyncio.get_running_loop()
+            user.hashed_password = await loop.run_in_executor(None, get_password_hash, form_data.password)
+            await db.commit()
+        
+        logger.debug("Login successful for user: %s", form_data.username)
         access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
         access_token = create_access_token(
-            data={"sub": user.username}, expires_delta=access_token_expires
+            data={"sub": user.username, "active": user.is_active}, expires_delta=access_token_expires
         )
         return {"access_token": access_token, "token_type": "bearer"}
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("Login error")
         return JSONResponse(status_code=500, content={"detail": f"Internal Login Error: {str(e)}"})
 
 @api_router.get("/users/me", response_model=User)
-async def read_users_me(current_user: UserDB = Depends(get_current_user)):
-    return User(username=current_user.username, is_active=current_user.is_active)
+async def read_users_me(db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
+    # The only route that reads the users table; everything else trusts the token claims
+    result = await db.execute(SELECT_USER_BY_NAME, {"username": current_user.username})
+    user = result.scalar_one_or_none()
+    if user is None:
+        raise HTTPException(
+            status_code=401,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return User(username=user.username, is_active=user.is_active)
 
 # 2. Protected Routes (Require Login)
 
 @api_router.get("/alerts", response_model=List[Alert])
-async def get_alerts(db: AsyncSession = Depends(get_db), current_user: UserDB = Depends(get_current_user)):
-    result = await db.execute(select(AlertDB).order_by(AlertDB.timestamp.desc()).limit(50))
-    return result.scalars().all()
+async def get_alerts(db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
+    result = await db.execute(SELECT_LATEST_ALERTS)
+    return json_list_response(ALERT_LIST_ADAPTER, result.mappings().all())
 
 @api_router.post("/alerts", response_model=Alert)
-async def create_alert(input: AlertCreate, db: AsyncSession = Depends(get_db), current_user: UserDB = Depends(get_current_user)):
+async def create_alert(input: AlertCreate, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
     new_alert = AlertDB(
         id=str(uuid.uuid4()),
         type=input.type,
@@ -278,23 +400,22 @@ async def create_alert(input: AlertCreate, db: AsyncSession = Depends(get_db), c
         acknowledged=False
     )
     db.add(new_alert)
+    # Column defaults are applied on flush, so no refresh SELECT is needed
     await db.commit()
-    await db.refresh(new_alert)
     return new_alert
 
 @api_router.patch("/alerts/{alert_id}/acknowledge", response_model=Alert)
-async def acknowledge_alert(alert_id: str, db: AsyncSession = Depends(get_db), current_user: UserDB = Depends(get_current_user)):
-    result = await db.execute(select(AlertDB).where(AlertDB.id == alert_id))
+async def acknowledge_alert(alert_id: str, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
+    # Single UPDATE ... RETURNING instead of SELECT + UPDATE + refresh
+    result = await db.execute(ACKNOWLEDGE_ALERT_BY_ID, {"alert_id": alert_id})
     alert = result.scalar_one_or_none()
     if not alert:
         raise HTTPException(status_code=404, detail="Alert not found")
-    alert.acknowledged = True
     await db.commit()
-    await db.refresh(alert)
     return alert
 
 @api_router.post("/alerts/acknowledge-all")
-async def acknowledge_all_alerts(db: AsyncSession = Depends(get_db), current_user: UserDB = Depends(get_current_user)):
+async def acknowledge_all_alerts(db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
     """Mark all alerts as acknowledged."""
     try:
         await db.execute(text("UPDATE alerts SET acknowledged = :ack"), {"ack": True})
@@ -305,17 +426,16 @@ async def acknowledge_all_alerts(db: AsyncSession = Depends(get_db), current_use
         raise HTTPException(status_code=500, detail=str(e))
 
 @api_router.delete("/alerts/{alert_id}")
-async def delete_alert(alert_id: str, db: AsyncSession = Depends(get_db), current_user: UserDB = Depends(get_current_user)):
-    result = await db.execute(select(AlertDB).where(AlertDB.id == alert_id))
-    alert = result.scalar_one_or_none()
-    if not alert:
-        raise HTTPException(status_code=404, detail="Alert not found")
-    await db.delete(alert)
+async def delete_alert(alert_id: str, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
+    # Single DELETE round-trip; rowcount tells us whether the alert existed
+    result = await db.execute(delete(AlertDB).where(AlertDB.id == alert_id))
     await db.commit()
+    if result.rowcount == 0:
+        raise HTTPException(status_code=404, detail="Alert not found")
     return {"status": "success"}
 
 @api_router.delete("/alerts")
-async def delete_all_alerts(db: AsyncSession = Depends(get_db), current_user: UserDB = Depends(get_current_user)):
+async def delete_all_alerts(db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
     """Clear all alerts from the database."""
     print(f"[DEBUG] DELETE /alerts called by {current_user.username}", flush=True)
     try:
@@ -370,41 +490,57 @@ async def thermal_camera_status():
             "error": str(e)
         }
 
+# Boot time never changes while we run; psutil.boot_time() re-parses /proc/stat on every call
+BOOT_TIME = psutil.boot_time()
+BOOT_TIME_STR = datetime.fromtimestamp(BOOT_TIME).strftime("%Y-%m-%d %H:%M:%S")
+
+# SoC temperature from sysfs. The file stays open and is re-read with pread at offset 0,
+# which makes the kernel regenerate the value without an open/close per poll.
+THERMAL_ZONE_PATH = "/sys/class/thermal/thermal_zone0/temp"
+thermal_zone_fd: Optional[int] = None
+
+def read_soc_temperature() -> Optional[float]:
+    """Return the SoC temperature in Celsius, or None when sysfs doesn't expose it."""
+    global thermal_zone_fd
+    try:
+        if thermal_zone_fd is None:
+            thermal_zone_fd = os.open(THERMAL_ZONE_PATH, os.O_RDONLY)
+        return int(os.pread(thermal_zone_fd, 16, 0)) / 1000.0
+    except (OSError, ValueError):
+        return None
+
+def root_disk_percent() -> float:
+    """Used space on / as psutil.disk_usage('/').percent reports it, from a single statvfs call."""
+    st = os.statvfs('/')
+    used = st.f_blocks - st.f_bfree
+    usable = used + st.f_bavail
+    return round(used / usable * 100, 1) if usable else 0.0
+
+# cpu_percent(interval=None) measures since the previous call; prime it so the first reading isn't a bogus 0.0
+psutil.cpu_percent(interval=None)
+
 @api_router.get("/system/diagnostics")
-async def get_system_diagnostics(token: str = Depends(oauth2_scheme)):
+async def get_system_diagnostics(current_user: User = Depends(get_current_user)):
     """Get CPU, RAM, Temp."""
     try:
-        cpu = psutil.cpu_percent()
-        ram = psutil.virtual_memory().percent
-        
-        # Temp (Pi specific)
-        temp = 0.0
-        try:
-            with open("/sys/class/thermal/thermal_zone0/temp", "r") as f:
-                temp = float(f.read()) / 1000.0
-        except:
-             # Mock temp for dev
-             temp = random.uniform(40.0, 60.0)
-
-        # Uptime
-        uptime = time.time() - psutil.boot_time()
-
+        # Same snapshot as /system-status: a second psutil collector would reset cpu_percent's window
+        status = await get_system_snapshot()
         return {
-            "cpu_usage": cpu,
-            "memory_usage": ram,
-            "temperature": temp,
-            "uptime": uptime,
-            "disk_usage": psutil.disk_usage('/').percent
+            "cpu_usage": status.cpu_usage,
+            "memory_usage": status.memory_usage,
+            # Mock temp for dev when sysfs has no SoC sensor
+            "temperature": status.temperature or random.uniform(40.0, 60.0),
+            "uptime": status.uptime,
+            "disk_usage": status.disk_usage
         }
     except Exception as e:
         logger.error(f"Diagnostics Error: {e}")
         return {"error": str(e)}
 
 @api_router.get("/scan/bluetooth")
-async def scan_bluetooth(token: str = Depends(oauth2_scheme)):
+async def scan_bluetooth(current_user: User = Depends(get_current_user)):
     """Returns cached signal data instantly."""
-    async with signal_cache_lock:
-        return signal_cache
+    return signal_cache
 
 @api_router.post("/thermal/test-alert")
 async def create_test_alert(db: AsyncSession = Depends(get_db)):
@@ -499,7 +635,7 @@ else:
     print("[GPS setup] U-blox7 Manager started.")
 
 @api_router.get("/gps", response_model=GPSData)
-async def get_gps(current_user: UserDB = Depends(get_current_user)):
+async def get_gps(current_user: User = Depends(get_current_user)):
     data = gps_reader.get_data()
     # Ensure timestamp is datetime
     if isinstance(data.get("timestamp"), str):
@@ -512,7 +648,7 @@ async def get_gps(current_user: UserDB = Depends(get_current_user)):
     return GPSData(**data)
 
 @api_router.get("/gps/debug")
-async def get_gps_debug(token: str = Depends(oauth2_scheme)):
+async def get_gps_debug(current_user: User = Depends(get_current_user)):
     """Debug endpoint — shows GPS port detection and raw reading from U-blox7."""
     detected_port = None
     all_ports_checked = []
@@ -533,51 +669,58 @@ async def get_gps_debug(token: str = Depends(oauth2_scheme)):
     }
 
 def get_pi_temperature():
-    try:
-        with open("/sys/class/thermal/thermal_zone0/temp", "r") as f:
-            temp_str = f.read()
-        return float(temp_str) / 1000.0
-    except:
-        return 0.0
+    temp = read_soc_temperature()
+    return temp if temp is not None else 0.0
 
-@api_router.get("/system-status", response_model=SystemStatus)
-async def get_system_status(current_user: UserDB = Depends(get_current_user)):
+# Latest metrics, refreshed by system_snapshot_loop() so requests never hit psutil/sysfs
+SYSTEM_SNAPSHOT_INTERVAL = 2.0
+system_snapshot: Optional[SystemStatus] = None
+
+def collect_system_status() -> SystemStatus:
     cpu = psutil.cpu_percent(interval=None)
     memory = psutil.virtual_memory().percent
-    disk = psutil.disk_usage('/').percent
-    boot_time = psutil.boot_time()
-    boot_dt = datetime.fromtimestamp(boot_time)
-    uptime = datetime.now().timestamp() - boot_time
+    disk = root_disk_percent()
+    uptime = time.time() - BOOT_TIME
     temp = get_pi_temperature()
     return SystemStatus(
         cpu_usage=cpu, memory_usage=memory, disk_usage=disk, temperature=temp, uptime=uptime,
-        boot_time_str=boot_dt.strftime("%Y-%m-%d %H:%M:%S")
+        boot_time_str=BOOT_TIME_STR
     )
 
+async def get_system_snapshot() -> SystemStatus:
+    global system_snapshot
+    if system_snapshot is None:
+        loop = asyncio.get_running_loop()
+        system_snapshot = await loop.run_in_executor(None, collect_system_status)
+    return system_snapshot
+
+@api_router.get("/system-status", response_model=SystemStatus)
+async def get_system_status(current_user: User = Depends(get_current_user)):
+    return await get_system_snapshot()
+
 # Status Check (Keep public? Or Protected? Let's protect to be safe)
 @api_router.post("/status", response_model=StatusCheck)
-async def create_status_check(input: StatusCheckCreate, db: AsyncSession = Depends(get_db), current_user: UserDB = Depends(get_current_user)):
+async def create_status_check(input: StatusCheckCreate, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
+    # Naive IST wall-clock time: exactly what SQLite stores and GET /status reads back,
+    # so the response matches the row without a refresh SELECT
     new_status = StatusCheckDB(
-        id=str(uuid.uuid4()), client_name=input.client_name, timestamp=get_ist_time()
+        id=str(uuid.uuid4()), client_name=input.client_name, timestamp=get_ist_time().replace(tzinfo=None)
     )
     db.add(new_status)
     await db.commit()
-    await db.refresh(new_status)
     return new_status
 
 @api_router.get("/status", response_model=List[StatusCheck])
-async def get_status_checks(db: AsyncSession = Depends(get_db), current_user: UserDB = Depends(get_current_user)):
-    result = await db.execute(select(StatusCheckDB).limit(100))
-    return result.scalars().all()
+async def get_status_checks(db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
+    result = await db.execute(SELECT_STATUS_CHECKS)
+    return json_list_response(STATUS_CHECK_LIST_ADAPTER, result.scalars().all())
 
-# Stream (Authentication via Query Param or Cookie for img tags)
 # Stream (Authentication via Query Param or Cookie for img tags)
 async def gen_frames(camera_type='thermal'):
     cam = camera.get_camera(camera_type)
     while True:
         frame = await cam.get_frame()
-        yield (b'--frame\r\n'
-               b'Content-Type: image/jpeg\r\n\r\n' + frame + b'\r\n')
+        yield camera.mjpeg_part(frame)
 
 
 
@@ -599,8 +742,6 @@ async def video_feed_rgb(token: Optional[str] = None):
 @api_router.get("/stream/rgb/frame")
 async def rgb_single_frame(t: Optional[str] = None):
     """Returns a single JPEG frame from Pi Camera. Use ?t=timestamp for cache busting."""
-    from fastapi.responses import Response
-    
     rgb_camera = camera.get_rgb_camera()
     frame = await rgb_camera.get_frame()
     
@@ -637,12 +778,61 @@ class CaptureResponse(BaseModel):
     filename: str
     timestamp: str
 
+CAPTURE_LIST_ADAPTER = TypeAdapter(List[CaptureResponse])
+
+# Newest-first gallery entries; when full, appendleft() drops gallery_index[-1] (the oldest).
+# Seeded from disk once in startup(), then kept in step with each capture so neither the
+# gallery nor cleanup has to rescan the directory. Only mutated on the event loop.
+MAX_CAPTURES = 100
+gallery_index = deque(maxlen=MAX_CAPTURES)
+
+def capture_entry(filename: str, mtime: float) -> CaptureResponse:
+    return CaptureResponse(
+        url=f"/static/captures/{filename}",
+        filename=filename,
+        timestamp=datetime.fromtimestamp(mtime).isoformat()
+    )
+
+def seed_gallery_index():
+    """Index existing captures with one scandir pass, pruning any beyond the limit (blocking)."""
+    # Filenames embed the capture time (capture_YYYYMMDD_HHMMSS_micros.jpg), so name order is capture order
+    with os.scandir(CAPTURE_DIR) as it:
+        entries = sorted(
+            (e for e in it if e.name.startswith("capture_") and e.name.endswith(".jpg")),
+            key=lambda e: e.name,
+            reverse=True,
+        )
+    for e in entries[MAX_CAPTURES:]:
+        try:
+            os.remove(e.path)
+        except OSError as err:
+            logger.warning("Could not prune capture %s: %s", e.name, err)
+    gallery_index.clear()
+    for e in entries[:MAX_CAPTURES]:
+        try:
+            gallery_index.append(capture_entry(e.name, e.stat().st_mtime))
+        except OSError as err:
+            logger.warning("Skipping unreadable capture %s: %s", e.name, err)
+
+def save_capture(filepath: Path, frame_bytes: bytes) -> float:
+    """Write a capture and return its mtime (blocking; run via the executor)."""
+    with open(filepath, "wb") as f:
+        f.write(frame_bytes)
+    return os.path.getmtime(filepath)
+
+def remove_capture(filename: str):
+    try:
+        os.remove(CAPTURE_DIR / filename)
+    except FileNotFoundError:
+        pass
+
 @api_router.post("/capture", response_model=CaptureResponse)
-async def capture_snapshot(current_user: UserDB = Depends(get_current_user)):
+async def capture_snapshot(current_user: User = Depends(get_current_user)):
     """Captures a FRESH frame directly from the camera stream to ensure 0-lag."""
     try:
-        # Use robust OpenCV capture from camera module
-        frame_bytes = camera.capture_fresh_frame()
+        loop = asyncio.get_running_loop()
+        # Use robust OpenCV capture from camera module (opens the stream, so keep it off the loop)
+        frame_bytes = await loop.run_in_executor(None, camera.capture_fresh_frame)
         
         if not frame_bytes:
             # Fallback or detail error
@@ -651,20 +841,19 @@ async def capture_snapshot(current_user: UserDB = Depends(get_current_user)):
         filename = f"capture_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.jpg"
         filepath = CAPTURE_DIR / filename
         
-        with open(filepath, "wb") as f:
-            f.write(frame_bytes)
-            
+        mtime = await loop.run_in_executor(None, save_capture, filepath, frame_bytes)
+        
+        # Index only once the file exists; no await between the check and the append,
+        # so concurrent captures can't evict the same file
+        entry = capture_entry(filename, mtime)
+        evicted = gallery_index[-1] if len(gallery_index) == gallery_index.maxlen else None
+        gallery_index.appendleft(entry)
+        
         # Clean up old images (Keep last 100)
-        files = sorted(glob.glob(str(CAPTURE_DIR / "capture_*.jpg")))
-        if len(files) > 100:
-            for f in files[:-100]:
-                os.remove(f)
-
-        return CaptureResponse(
-            url=f"/static/captures/{filename}",
-            filename=filename,
-            timestamp=datetime.now().isoformat()
-        )
+        if evicted is not None:
+            await loop.run_in_executor(None, remove_capture, evicted.filename)
+
+        return entry
     except Exception as e:
         logger.error(f"Capture failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -672,40 +861,23 @@ async def capture_snapshot(current_user: UserDB = Depends(get_current_user)):
 
 
 @api_router.get("/gallery", response_model=List[CaptureResponse])
-async def get_gallery(current_user: UserDB = Depends(get_current_user)):
+async def get_gallery(current_user: User = Depends(get_current_user)):
     """Returns list of captured images, sorted newest first."""
-    files = sorted(glob.glob(str(CAPTURE_DIR / "capture_*.jpg")), reverse=True)
-    response = []
-    
-    for f in files:
-        filename = os.path.basename(f)
-        # Extract timestamp from filename capture_YYYYMMDD_HHMMSS_micros.jpg
-        # Or just use file mtime? Filename is safer if touched.
-        try:
-            ts_str = filename.replace("capture_", "").replace(".jpg", "")
-            # Basic parsing or just return isoformat of mtime
-            timestamp = datetime.fromtimestamp(os.path.getmtime(f)).isoformat()
-        except:
-            timestamp = ""
-            
-        response.append(CaptureResponse(
-            url=f"/static/captures/{filename}",
-            filename=filename,
-            timestamp=timestamp
-        ))
-    return response
+    # Entries are already validated models, so only serialize
+    return Response(content=CAPTURE_LIST_ADAPTER.dump_json(list(gallery_index)), media_type="application/json")
 
 
 # --------------------------
 # App Application
 # --------------------------
-app = FastAPI(title="RESOFLY API")
+# orjson (Rust) serializes datetime/float-heavy payloads several times faster than stdlib json
+app = FastAPI(title="RESOFLY API", default_response_class=ORJSONResponse)
 
 # CORS
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
-    allow_origins=os.environ.get('CORS_ORIGINS', '*').split(','),
+    allow_origins=CORS_ORIGINS,
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -713,6 +885,8 @@ app.add_middleware(
 # --------------------------
 # WebSocket Connection Manager
 # --------------------------
+WS_SEND_TIMEOUT = 2.0  # Seconds before a stalled client is dropped from broadcasts
+
 class WebSocketConnectionManager:
     """Manages WebSocket connections for real-time alert broadcasting."""
     
@@ -733,18 +907,26 @@ class WebSocketConnectionManager:
         if not self.active_connections:
             return
         
-        message = json.dumps(data)
-        disconnected = set()
+        # Encoded once for every client; kept as a text frame since the dashboard JSON.parse()s event.data
+        message = orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY).decode()
         
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message)
-            except Exception:
-                disconnected.add(connection)
+        # Fan out concurrently; a client that can't take the message within the timeout is dropped
+        connections = list(self.active_connections)
+        results = await asyncio.gather(
+            *(asyncio.wait_for(conn.send_text(message), WS_SEND_TIMEOUT) for conn in connections),
+            return_exceptions=True,
+        )
         
-        # Clean up disconnected
-        for conn in disconnected:
-            self.active_connections.discard(conn)
+        # Clean up disconnected or stalled clients, closing the socket so the dashboard reconnects
+        dropped = [conn for conn, result in zip(connections, results) if isinstance(result, BaseException)]
+        for conn in dropped:
+            self.disconnect(conn)
+        if dropped:
+            await asyncio.gather(*(self._close(conn) for conn in dropped))
+    
+    async def _close(self, websocket: WebSocket):
+        with suppress(Exception):
+            await asyncio.wait_for(websocket.close(code=1011), WS_SEND_TIMEOUT)
 
 ws_manager = WebSocketConnectionManager()
 
@@ -752,9 +934,9 @@ ws_manager = WebSocketConnectionManager()
 thermal_frame_pipeline = None
 
 # Global variables for synchronized streaming
-latest_thermal_frame = None
+latest_thermal_frame = None  # Multipart-framed JPEG, shared by every /thermal/ client
 latest_thermal_frame_id = 0
-thermal_no_signal = None  # Pre-generated "no signal" frame for fallback
+thermal_no_signal = None  # Pre-generated, pre-framed "no signal" frame for fallback
 
 # --------------------------
 # WebSocket Endpoint
@@ -795,21 +977,16 @@ async def thermal_stream():
          cv2.putText(no_signal, "THERMAL", (180, 220), cv2.FONT_HERSHEY_SIMPLEX, 1.8, (0, 180, 255), 3)
          cv2.putText(no_signal, "Waiting for sensor data...", (140, 280), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (100, 100, 100), 1)
          _, no_signal_jpeg = cv2.imencode('.jpg', no_signal, [cv2.IMWRITE_JPEG_QUALITY, 70])
-         thermal_no_signal = no_signal_jpeg.tobytes()
+         thermal_no_signal = camera.mjpeg_part(no_signal_jpeg)
 
     async def generate():
         last_sent_id = -1
         while True:
             # Yield frame only if it has been updated globally
             if latest_thermal_frame_id != last_sent_id:
-                frame_bytes = latest_thermal_frame if latest_thermal_frame is not None else thermal_no_signal
-                yield (
-                    b'--frame\r\n'
-                    b'Content-Type: image/jpeg\r\n\r\n' +
-                    frame_bytes +
-                    b'\r\n'
-                )
+                # Record the id before yielding: a frame published while the send is in flight must not be skipped
                 last_sent_id = latest_thermal_frame_id
+                yield latest_thermal_frame if latest_thermal_frame is not None else thermal_no_signal
             
             # Polling delay. The pipeline dictates the FPS. Clients just poll memory.
             await asyncio.sleep(0.05)
@@ -830,57 +1007,61 @@ async def thermal_stream():
 # Startup
 @app.on_event("startup")
 async def startup():
-    global signal_cache_lock
-    signal_cache_lock = asyncio.Lock()
+    try:
+        await asyncio.get_running_loop().run_in_executor(None, seed_gallery_index)
+    except Exception as e:
+        logger.warning("Could not index captures: %s", e)
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        # create_all() skips indexes added to tables that already exist
+        await conn.run_sync(lambda sync_conn: [
+            index.create(sync_conn, checkfirst=True) for index in AlertDB.__table__.indexes
+        ])
     
     # 1. Create or Update Default Admin (separate try block)
     try:
         async with AsyncSessionLocal() as db:
-            result = await db.execute(select(UserDB).where(UserDB.username == "admin"))
+            result = await db.execute(SELECT_USER_BY_NAME, {"username": "admin"})
             user = result.scalar_one_or_none()
             
-            hashed_pwd = get_password_hash("resofly123")
-            
+            # Only hash when there is something to write; set FORCE_ADMIN_RESET=1 to restore the default password
             if not user:
-                print("Creating default admin user...")
-                admin_user = UserDB(username="admin", hashed_password=hashed_pwd)
+                logger.info("Creating default admin user...")
+                admin_user = UserDB(username="admin", hashed_password=get_password_hash("resofly123"))
                 db.add(admin_user)
-            else:
-                user.hashed_password = hashed_pwd
+                await db.commit()
+            elif os.environ.get("FORCE_ADMIN_RESET") == "1":
+                logger.info("Resetting admin password to default...")
+                user.hashed_password = get_password_hash("resofly123")
+                await db.commit()
             
-            await db.commit()
-            print("Admin user ready", flush=True)
+            logger.info("Admin user ready")
     except Exception as e:
-        print(f"Warning: Could not setup admin user: {e}", flush=True)
+        logger.warning("Could not setup admin user: %s", e)
     
     # 2. Log System Startup (separate try block, optional)
     try:
         async with AsyncSessionLocal() as db:
             # WIPE ENTIRE DATABASE ON STARTUP AS REQUESTED
-            from sqlalchemy import delete
+            # Wipe and startup alert share one transaction: a single commit (and WAL sync) instead of two
             await db.execute(delete(AlertDB))
+            await db.execute(insert(AlertDB), [{
+                "id": str(uuid.uuid4()),
+                "type": 'info',
+                "title": 'System Online',
+                "message": 'ResoFly Backend started successfully.',
+                "timestamp": get_ist_time(),
+                "acknowledged": False,
+                "lat": 9.510579,
+                "lon": 76.550428,
+                "confidence": 1.0,
+                "max_temp": 0.0,
+            }])
             await db.commit()
-            print("[DB] Cleared previous alerts on startup.", flush=True)
-
-            startup_alert = AlertDB(
-                id=str(uuid.uuid4()),
-                type='info',
-                title='System Online',
-                message='ResoFly Backend started successfully.',
-                timestamp=get_ist_time(),
-                acknowledged=False,
-                lat=9.510579,
-                lon=76.550428,
-                confidence=1.0,
-                max_temp=0.0
-            )
-            db.add(startup_alert)
-            await db.commit()
-            print("Startup alert logged", flush=True)
+            logger.info("[DB] Cleared previous alerts on startup.")
+            logger.info("Startup alert logged")
     except Exception as e:
-        print(f"Warning: Could not log startup alert: {e}", flush=True)
+        logger.warning("Could not log startup alert: %s", e)
             
     # 3. Initialize Synchronized Thermal Pipeline
     # Priority: Live Waveshare HAT > Dataset video fallback
@@ -915,8 +1096,9 @@ async def startup():
 
         # Detection callback - creates alerts and broadcasts via WebSocket
         def on_detection_event(event: thermal_pipeline.DetectionEvent):
-            print(f"[DEBUG] on_detection_event CALLED! Frame: {event.frame_number}, Hotspots: {len(event.hotspots)}", flush=True)
             """Handle detection event - save to DB and broadcast."""
+            # Runs on the thermal thread for every detecting frame: lazy %-args, no forced flush
+            logger.debug("on_detection_event frame %d, hotspots %d", event.frame_number, len(event.hotspots))
             # Get GPS - use actual live data from U-blox7
             lat = 0.0
             lon = 0.0
@@ -927,66 +1109,70 @@ async def startup():
                 if gps_data.get('latitude') and gps_data.get('latitude') != 0.0:
                     lat, lon = gps_data['latitude'], gps_data['longitude']
             
-            # Create alert in database - schedule on the running event loop SAFELY
-            async def save_and_broadcast():
+            # Runs on the main loop: builds the frame's rows and WebSocket message for alert_flusher,
+            # which broadcasts only after the rows are committed (so clients never see unsaved ids)
+            def queue_frame_alerts():
                 try:
-                    async with AsyncSessionLocal() as db:
-                        for hotspot in event.hotspots:
-                            # Use track_id if available, else standard index
-                            obj_id = hotspot.track_id if hotspot.track_id is not None else 0
-                            
-                            # Unique GPS offset based on ID (consistent position for same ID)
-                            person_lat = lat + ((obj_id % 10) * 0.0005)
-                            person_lon = lon + ((obj_id % 10) * 0.0003)
-                            
-                            alert_id = str(uuid.uuid4())
-                            
-                            alert = AlertDB(
-                                id=alert_id,
-                                type='LIFE',
-                                title=f'PERSON #{obj_id} DETECTED',
-                                message=f"New target tracked (ID: {obj_id}, {hotspot.estimated_temp:.0f}°C, {int(hotspot.confidence*100)}%)",
-                                timestamp=event.timestamp,
-                                acknowledged=False,
-                                lat=person_lat,
-                                lon=person_lon,
-                                confidence=hotspot.confidence,
-                                max_temp=hotspot.estimated_temp
-                            )
-                            db.add(alert)
-                            
-                            # Broadcast each alert via WebSocket
-                            alert_data = {
-                                "id": alert_id,
-                                "type": "LIFE",
-                                "title": f"PERSON #{obj_id}",
-                                "confidence": hotspot.confidence,
-                                "max_temp": hotspot.estimated_temp,
-                                "estimated_temp": hotspot.estimated_temp,
-                                "lat": person_lat,
-                                "lon": person_lon,
-                                "timestamp": event.timestamp.isoformat(),
-                                "frame": event.frame_number,
-                                "track_id": obj_id,
-                                "total_count": event.total_count
-                            }
-                            await ws_manager.broadcast(alert_data)
+                    rows = []
+                    alerts_list = []
+                    # One urandom read for the whole frame instead of one per uuid4() call
+                    entropy = os.urandom(16 * len(event.hotspots))
+                    alert_ids = [str(uuid.UUID(bytes=entropy[i:i + 16], version=4))
+                                 for i in range(0, len(entropy), 16)]
+                    for hotspot, alert_id in zip(event.hotspots, alert_ids):
+                        # Use track_id if available, else standard index
+                        obj_id = hotspot.track_id if hotspot.track_id is not None else 0
                         
-                        await db.commit()
-                        print(f"[ALERT] Saved {len(event.hotspots)} detections to DB", flush=True)
+                        # Unique GPS offset based on ID (consistent position for same ID)
+                        person_lat = lat + ((obj_id % 10) * 0.0005)
+                        person_lon = lon + ((obj_id % 10) * 0.0003)
+                        
+                        rows.append({
+                            "id": alert_id,
+                            "type": 'LIFE',
+                            "title": f'PERSON #{obj_id} DETECTED',
+                            "message": f"New target tracked (ID: {obj_id}, {hotspot.estimated_temp:.0f}°C, {int(hotspot.confidence*100)}%)",
+                            "timestamp": event.timestamp,
+                            "acknowledged": False,
+                            "lat": person_lat,
+                            "lon": person_lon,
+                            "confidence": hotspot.confidence,
+                            "max_temp": hotspot.estimated_temp
+                        })
+                        
+                        alerts_list.append({
+                            "id": alert_id,
+                            "type": "LIFE",
+                            "title": f"PERSON #{obj_id}",
+                            "confidence": hotspot.confidence,
+                            "max_temp": hotspot.estimated_temp,
+                            "estimated_temp": hotspot.estimated_temp,
+                            "lat": person_lat,
+                            "lon": person_lon,
+                            "timestamp": event.timestamp.isoformat(),
+                            "frame": event.frame_number,
+                            "track_id": obj_id,
+                            "total_count": event.total_count
+                        })
                     
-                    print(f"[THERMAL] ✓ {len(event.hotspots)} alerts sent for frame {event.frame_number}")
+                    # One WebSocket message per frame rather than one per hotspot
+                    alert_queue.put_nowait((rows, {
+                        "type": "alerts_batch",
+                        "frame": event.frame_number,
+                        "alerts": alerts_list
+                    }))
                 except Exception as e:
-                    print(f"[THERMAL] Error in save_and_broadcast: {e}")
+                    logger.error("Error queueing alerts: %s", e)
             
-            # Schedule on the main loop from the thermal thread
+            # Schedule on the main loop from the thermal thread. Nothing waits on the result,
+            # so skip run_coroutine_threadsafe's concurrent.futures.Future bridging
             try:
                 if main_loop.is_running():
-                    asyncio.run_coroutine_threadsafe(save_and_broadcast(), main_loop)
+                    main_loop.call_soon_threadsafe(queue_frame_alerts)
                 else:
-                     print("[ERROR] Main loop is closed, cannot save alert", flush=True)
+                     logger.error("Main loop is closed, cannot save alert")
             except Exception as e:
-                 print(f"[ERROR] Could not schedule alert task: {e}", flush=True)
+                 logger.error("Could not schedule alert task: %s", e)
         
         # Create the unified pipeline
         global thermal_frame_pipeline
@@ -1000,36 +1186,128 @@ async def startup():
         thermal_frame_pipeline = None
 
     # 4. Start background monitor loops
-    asyncio.create_task(background_monitor())
-    asyncio.create_task(signal_monitor_loop())
+    global alert_queue
+    alert_queue = asyncio.Queue()
+    # The loop only holds weak references to tasks; keep ours so they can't be garbage-collected
+    app.state.background_tasks = [
+        asyncio.create_task(alert_flusher(), name="alert_flusher"),
+        asyncio.create_task(system_snapshot_loop(), name="system_snapshot"),
+        asyncio.create_task(background_monitor(), name="background_monitor"),
+        asyncio.create_task(signal_monitor_loop(), name="signal_monitor"),
+    ]
     
     if thermal_frame_pipeline is not None:
-       asyncio.create_task(thermal_processing_loop())
+       app.state.background_tasks.append(asyncio.create_task(thermal_processing_loop(), name="thermal_processing"))
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    tasks = getattr(app.state, "background_tasks", [])
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    
+    # Don't lose detections still waiting for the next batched commit
+    frames = []
+    while alert_queue is not None and not alert_queue.empty():
+        frames.append(alert_queue.get_nowait())
+    if frames:
+        await flush_alert_frames(frames)
+
+# Detection alerts are committed in batches: one transaction (and one WAL fsync) per
+# ALERT_FLUSH_INTERVAL or ALERT_FLUSH_MAX rows instead of one per detection frame
+ALERT_FLUSH_INTERVAL = 0.25  # Seconds
+ALERT_FLUSH_MAX = 50
+alert_queue: Optional[asyncio.Queue] = None  # Created at startup; items are (AlertDB row dicts, WebSocket message), one per frame
+
+async def write_alert_rows(rows: List[dict]) -> bool:
+    try:
+        async with AsyncSessionLocal() as db:
+            # One executemany INSERT instead of per-object unit-of-work bookkeeping
+            await db.execute(insert(AlertDB), rows)
+            await db.commit()
+        logger.debug("Saved %d detections to DB", len(rows))
+        return True
+    except Exception as e:
+        logger.error("Error saving detections: %s", e)
+        return False
+
+async def flush_alert_frames(frames: list):
+    """Commit the queued frames' alerts, then broadcast them; unsaved alerts are never announced."""
+    if not await write_alert_rows([row for rows, _ in frames for row in rows]):
+        return
+    for _, message in frames:
+        await ws_manager.broadcast(message)
+
+async def alert_flusher():
+    """Drains alert_queue into batched INSERTs."""
+    loop = asyncio.get_running_loop()
+    while True:
+        frames = [await alert_queue.get()]
+        row_count = len(frames[0][0])
+        deadline = loop.time() + ALERT_FLUSH_INTERVAL
+        try:
+            while row_count < ALERT_FLUSH_MAX:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    frames.append(await asyncio.wait_for(alert_queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+                row_count += len(frames[-1][0])
+        finally:
+            # Also runs when cancelled at shutdown, so a half-collected batch is still written
+            await flush_alert_frames(frames)
+
+# Single worker: the pipeline is stateful, and a dedicated thread keeps frame processing
+# from competing with DB/psutil/capture jobs in the default executor
+thermal_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="thermal")
+THERMAL_JPEG_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, 80]
+THERMAL_FRAME_INTERVAL = 0.1  # Seconds per processed frame (~10 FPS)
+
+def process_and_encode_thermal() -> Optional[bytes]:
+    """Run the pipeline and return the frame as a multipart JPEG part (blocking; run via thermal_executor)."""
+    frame = thermal_frame_pipeline.process_next()
+    if frame is None:
+        return None
+    ok, jpeg = cv2.imencode('.jpg', frame, THERMAL_JPEG_PARAMS)
+    # Framed once here rather than per client per frame; join() reads the encoded array directly
+    return camera.mjpeg_part(jpeg) if ok else None
 
 async def thermal_processing_loop():
     """Continuous background loop for processing thermal frames."""
     global latest_thermal_frame, latest_thermal_frame_id, thermal_frame_pipeline
     print("[THERMAL] Background processing loop started", flush=True)
     loop = asyncio.get_running_loop()
+    # Pace against a monotonic deadline so processing time doesn't stretch the frame interval
+    next_deadline = loop.time() + THERMAL_FRAME_INTERVAL
     
     while True:
         try:
-            # Process next frame in the background thread pool
-            frame = await loop.run_in_executor(None, thermal_frame_pipeline.process_next)
+            # Process and encode off the event loop; libjpeg is the other big per-frame cost
+            frame_bytes = await loop.run_in_executor(thermal_executor, process_and_encode_thermal)
             
-            if frame is not None:
-                 # Encode as jpeg
-                 _, jpeg = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 80])
+            if frame_bytes is not None:
                  # Update global buffer safely
-                 latest_thermal_frame = jpeg.tobytes()
+                 latest_thermal_frame = frame_bytes
                  latest_thermal_frame_id += 1
             
             # Target ~10 FPS for the loop pipeline
-            await asyncio.sleep(0.1)
+            now = loop.time()
+            if now > next_deadline + 1.0:
+                # Fell well behind (slow frames or a stall): resync instead of bursting to catch up
+                next_deadline = now
+            await asyncio.sleep(max(0.0, next_deadline - now))
+            next_deadline += THERMAL_FRAME_INTERVAL
         
         except Exception as e:
             print(f"[THERMAL] Processing loop error: {e}", flush=True)
             await asyncio.sleep(1)
+            next_deadline = loop.time() + THERMAL_FRAME_INTERVAL
+
+# Scans hold the radio for seconds at a time; give them their own thread so they never
+# tie up default-executor workers needed by DB/psutil/capture jobs
+scan_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scan")
 
 async def signal_monitor_loop():
     """Continuous background scanning for signals (Zero-Lag Architecture)."""
@@ -1040,17 +1318,12 @@ async def signal_monitor_loop():
             loop = asyncio.get_running_loop()
             
             # Bluetooth scan only (WiFi GPS fallback removed)
-            bt_task = loop.run_in_executor(None, bluetooth_scanner.get_bluetooth_devices)
+            bt_task = loop.run_in_executor(scan_executor, bluetooth_scanner.get_bluetooth_devices)
+            # Scanner returns devices already tagged and sorted strongest-first
             bt_devices = await bt_task
             
-            now = datetime.now()
-            for d in bt_devices: d['type'] = 'bluetooth'
-            
-            all_devices = sorted(bt_devices, key=lambda x: x.get('rssi', -100), reverse=True)
-            
-            # Atomic update of global cache
-            async with signal_cache_lock:
-                signal_cache = all_devices
+            # Atomic update of global cache (single reference swap)
+            signal_cache = bt_devices
             
             # Substantial sleep between scans to prevent 100% CPU and Wi-Fi interface drops!
             # Continuous iwlist scanning will cause the wlan0 interface to drop packets and kill Cloudflare Tunnel.
@@ -1060,6 +1333,18 @@ async def signal_monitor_loop():
             print(f"[SIGNAL] Background loop error: {e}", flush=True)
             await asyncio.sleep(10)
 
+async def system_snapshot_loop():
+    """Refreshes the shared system metrics snapshot."""
+    global system_snapshot
+    loop = asyncio.get_running_loop()
+    while True:
+        try:
+            # statvfs + /proc + sysfs reads stay off the event loop
+            system_snapshot = await loop.run_in_executor(None, collect_system_status)
+        except Exception as e:
+            print(f"[SYSTEM] Snapshot error: {e}", flush=True)
+        await asyncio.sleep(SYSTEM_SNAPSHOT_INTERVAL)
+
 async def background_monitor():
     """Periodically checks system health and logs alerts."""
     while True:
@@ -1067,9 +1352,10 @@ async def background_monitor():
             # Check every 60 seconds
             await asyncio.sleep(60) 
             
-            cpu = psutil.cpu_percent(interval=None)
-            disk = psutil.disk_usage('/').percent
-            temp = get_pi_temperature()
+            status = system_snapshot or await asyncio.get_running_loop().run_in_executor(None, collect_system_status)
+            cpu = status.cpu_usage
+            disk = status.disk_usage
+            temp = status.temperature
             
             alerts_to_add = []
             
@@ -1088,16 +1374,12 @@ async def background_monitor():
             
             if alerts_to_add:
                 async with AsyncSessionLocal() as db:
-                    for type_, title, msg in alerts_to_add:
-                        # Check duplicate logic could go here to prevent spamming
-                        new_alert = AlertDB(
-                            id=str(uuid.uuid4()),
-                            type=type_,
-                            title=title,
-                            message=msg,
-                            timestamp=datetime.utcnow()
-                        )
-                        db.add(new_alert)
+                    # Check duplicate logic could go here to prevent spamming
+                    now = datetime.utcnow()
+                    await db.execute(insert(AlertDB), [
+                        {"id": str(uuid.uuid4()), "type": type_, "title": title, "message": msg, "timestamp": now}
+                        for type_, title, msg in alerts_to_add
+                    ])
                     await db.commit()
                     
         except Exception as e:
@@ -1121,14 +1403,25 @@ if DIST_DIR.exists():
     # Mount Static Captures
     app.mount("/static", StaticFiles(directory=str(ROOT_DIR / "static")), name="static")
     
+    # The build output doesn't change while we run: resolve it once so the SPA fallback
+    # is a dict lookup instead of exists()/is_file() stats on every request
+    DIST_FILES = {p.relative_to(DIST_DIR).as_posix(): str(p) for p in DIST_DIR.rglob("*") if p.is_file()}
+    DIST_INDEX = str(DIST_DIR / "index.html")
+    
     @app.get("/{full_path:path}")
     async def serve_frontend(full_path: str):
-        file_path = DIST_DIR / full_path
-        if file_path.exists() and file_path.is_file():
-            return FileResponse(str(file_path))
-        return FileResponse(str(DIST_DIR / "index.html"))
+        return FileResponse(DIST_FILES.get(full_path, DIST_INDEX))
 
 if __name__ == "__main__":
     import uvicorn
-    # Use 0.0.0.0 to listen on all interfaces
-    uvicorn.run(app, host="0.0.0.0", port=int(os.environ.get("PORT", 5000)))
+    # Use 0.0.0.0 to listen on all interfaces.
+    # "auto" selects uvloop and httptools when installed (see requirements.txt) and falls back to
+    # asyncio/h11 otherwise; per-request access logging is off since the UI polls several endpoints.
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=int(os.environ.get("PORT", 5000)),
+        loop="auto",
+        http="auto",
+        access_log=os.environ.get("ACCESS_LOG") == "1",
+    )
@@ -16,6 +16,7 @@ import numpy as np
 from pathlib import Path
 from typing import List, Optional, Tuple
 from dataclasses import dataclass
+from operator import attrgetter
 
 
 @dataclass
@@ -52,18 +53,27 @@ class ThermalDetector:
         self.min_area = min_area
         self.blur_kernel = blur_kernel
         self.adaptive = adaptive
+        # Blur/threshold outputs, kept between frames
+        self._blur_buf = None
+        self._binary_buf = None
+    
+    def _ensure_buffers(self, frame: np.ndarray):
+        if self._blur_buf is None or self._blur_buf.shape != frame.shape:
+            self._blur_buf = np.empty(frame.shape, dtype=np.uint8)
+            self._binary_buf = np.empty(frame.shape, dtype=np.uint8)
     
     def preprocess(self, frame: np.ndarray) -> np.ndarray:
-        """Normalize and denoise the frame."""
+        """Normalize and denoise the frame. The returned image is reused by the next call."""
         # Ensure grayscale
         if len(frame.shape) == 3:
             frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
         
         # Normalize to 0-255
-        frame = cv2.normalize(frame, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)
+        frame = cv2.normalize(frame, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8, copy=False)
         
         # Gaussian blur for noise reduction
-        frame = cv2.GaussianBlur(frame, (self.blur_kernel, self.blur_kernel), 0)
+        self._ensure_buffers(frame)
+        frame = cv2.GaussianBlur(frame, (self.blur_kernel, self.blur_kernel), 0, dst=self._blur_buf)
         
         return frame
     
@@ -73,34 +83,39 @@ class ThermalDetector:
         
         Returns:
             hotspots: List of detected hotspots
-            binary: The thresholded binary image (for visualization)
+            binary: The thresholded binary image (for visualization; reused by the next call)
         """
+        self._ensure_buffers(frame)
         # Adaptive thresholding: use frame statistics
         if self.adaptive:
-            mean = np.mean(frame)
-            std = np.std(frame)
+            mean_arr, std_arr = cv2.meanStdDev(frame)
+            mean = float(mean_arr[0, 0])
+            std = float(std_arr[0, 0])
             thresh_val = min(250, int(mean + 1.5 * std))
             thresh_val = max(thresh_val, 150)  # Don't go too low
         else:
             thresh_val = self.threshold_value
         
         # Binary threshold
-        _, binary = cv2.threshold(frame, thresh_val, 255, cv2.THRESH_BINARY)
+        _, binary = cv2.threshold(frame, thresh_val, 255, cv2.THRESH_BINARY, dst=self._binary_buf)
         
-        # Find contours
+        # Find contours (nothing to trace on an all-black mask)
+        if cv2.countNonZero(binary) == 0:
+            return [], binary
         contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         
         hotspots = []
         for cnt in contours:
-            area = cv2.contourArea(cnt)
+            x, y, w, h = cv2.boundingRect(cnt)
+            if w * h < self.min_area:
+                continue
             
+            area = cv2.contourArea(cnt)
             if area >= self.min_area:
-                x, y, w, h = cv2.boundingRect(cnt)
-                
-                # Get max intensity in this region
-                mask = np.zeros(frame.shape, dtype=np.uint8)
-                cv2.drawContours(mask, [cnt], -1, 255, -1)
-                max_intensity = float(np.max(frame[mask == 255]))
+                # Get max intensity inside the contour (ROI-local mask)
+                roi_mask = np.zeros((h, w), dtype=np.uint8)
+                cv2.drawContours(roi_mask, [cnt], -1, 255, -1, offset=(-x, -y))
+                _, max_intensity, _, _ = cv2.minMaxLoc(frame[y:y+h, x:x+w], mask=roi_mask)
                 
                 # Confidence based on how much hotter than threshold
                 intensity_diff = max_intensity - thresh_val
@@ -117,7 +132,7 @@ class ThermalDetector:
                 ))
         
         # Sort by confidence (highest first)
-        hotspots.sort(key=lambda h: h.confidence, reverse=True)
+        hotspots.sort(key=attrgetter('confidence'), reverse=True)
         
         return hotspots, binary
     
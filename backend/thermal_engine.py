@@ -77,6 +77,27 @@ class DetectionEngine:
         # Fire/large heat source > 100 pixels
         self.life_max_area = 100 if low_res_mode else 500
         
+        # Adaptive CLAHE tile size based on resolution
+        tile_size = (4, 4) if low_res_mode else (8, 8)
+        self.clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=tile_size)
+        # Kernel for morphological opening (smaller kernel for low-res)
+        kernel_size = 2 if low_res_mode else 3
+        self.morph_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (kernel_size, kernel_size))
+        
+        # dst arrays for CLAHE, threshold, opening and blob masks
+        self._enhanced_buf = None
+        self._binary_buf = None
+        self._opened_buf = None
+        self._roi_mask_buf = None
+    
+    def _ensure_buffers(self, frame):
+        if self._enhanced_buf is None or self._enhanced_buf.shape != frame.shape:
+            self._enhanced_buf = np.empty(frame.shape, dtype=np.uint8)
+            self._binary_buf = np.empty(frame.shape, dtype=np.uint8)
+            self._opened_buf = np.empty(frame.shape, dtype=np.uint8)
+            # Scratch for per-blob contour masks
+            self._roi_mask_buf = np.empty(frame.shape, dtype=np.uint8)
+        
     def process(self, frame):
         """
         Frame: 8-bit grayscale frame
@@ -84,39 +105,42 @@ class DetectionEngine:
         """
         if frame is None:
             return [], {}
+        self._ensure_buffers(frame)
 
         # 1. Enhance and Normalize
-        # Adaptive CLAHE tile size based on resolution
-        tile_size = (4, 4) if self.low_res_mode else (8, 8)
-        clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=tile_size)
-        enhanced = clahe.apply(frame)
+        enhanced = self.clahe.apply(frame, self._enhanced_buf)
         
         # 2. Dynamic Thresholding
-        avg = np.mean(enhanced)
-        std = np.std(enhanced)
+        avg_arr, std_arr = cv2.meanStdDev(enhanced)
+        avg = float(avg_arr[0, 0])
+        std = float(std_arr[0, 0])
         
         # Use mean + std deviation for more adaptive threshold
         thresh_val = min(240, avg + self.threshold_offset)
-        _, binary = cv2.threshold(enhanced, thresh_val, 255, cv2.THRESH_BINARY)
+        _, binary = cv2.threshold(enhanced, thresh_val, 255, cv2.THRESH_BINARY, dst=self._binary_buf)
         
-        # 3. Noise Removal (smaller kernel for low-res)
-        kernel_size = 2 if self.low_res_mode else 3
-        kernel = np.ones((kernel_size, kernel_size), np.uint8)
-        binary = cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel)
+        # 3. Noise Removal
+        binary = cv2.morphologyEx(binary, cv2.MORPH_OPEN, self.morph_kernel, dst=self._opened_buf)
         
-        # 4. Blob Detection
-        contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        # 4. Blob Detection (empty scene: skip the trace)
+        if cv2.countNonZero(binary) == 0:
+            contours = ()
+        else:
+            contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         
         detections = []
         for cnt in contours:
+            x, y, w, h = cv2.boundingRect(cnt)
+            if w * h < self.min_area:
+                continue
+            
             area = cv2.contourArea(cnt)
             if area >= self.min_area:
-                x, y, w, h = cv2.boundingRect(cnt)
-                
                 # Get max intensity inside contour
-                mask = np.zeros(enhanced.shape, dtype=np.uint8)
-                cv2.drawContours(mask, [cnt], -1, 255, -1)
-                min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(enhanced, mask=mask)
+                roi_mask = self._roi_mask_buf[:h, :w]
+                roi_mask.fill(0)
+                cv2.drawContours(roi_mask, [cnt], -1, 255, -1, offset=(-x, -y))
+                _, max_val, _, _ = cv2.minMaxLoc(enhanced[y:y+h, x:x+w], mask=roi_mask)
                 
                 # Calculate confidence based on intensity differential
                 intensity_diff = max_val - avg
@@ -155,6 +179,8 @@ class ThermalDetectionService:
         self.running = False
         self.thread = None
         self.source_type = None
+        # Set by stop() so the worker's throttle waits end immediately
+        self._stop_event = threading.Event()
         
         # Select source
         hw = WaveshareThermalSource()
@@ -176,6 +202,7 @@ class ThermalDetectionService:
     def start(self):
         if not self.running and self.source:
             self.running = True
+            self._stop_event.clear()
             self.thread = threading.Thread(target=self._worker, daemon=True)
             self.thread.start()
             logger.info("Thermal Detection Service Started")
@@ -184,6 +211,7 @@ class ThermalDetectionService:
 
     def stop(self):
         self.running = False
+        self._stop_event.set()
         if self.thread:
             self.thread.join()
 
@@ -197,8 +225,10 @@ class ThermalDetectionService:
         while self.running:
             # Throttle detection to ~5 FPS to save CPU on Pi
             now = time.time()
-            if now - last_process_time < 0.2:
-                time.sleep(0.01)
+            remaining = 0.2 - (now - last_process_time)
+            if remaining > 0:
+                # One timed wait for the rest of the interval instead of 10ms polling
+                self._stop_event.wait(remaining)
                 continue
             
             try:
@@ -225,10 +255,10 @@ class ThermalDetectionService:
                 else:
                     if frame_count == 0:
                         print("[THERMAL WORKER] Waiting for first frame...")
-                    time.sleep(1.0)
+                    self._stop_event.wait(1.0)
             except Exception as e:
                 print(f"[THERMAL WORKER] Error: {e}")
                 import traceback
                 traceback.print_exc()
-                time.sleep(1.0)
+                self._stop_event.wait(1.0)
 
@@ -11,12 +11,14 @@ Features:
 
 import cv2
 import numpy as np
+import math
 import time
 import asyncio
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Tuple, Callable, Dict
 from dataclasses import dataclass, field
+from operator import attrgetter
 
 import logging
 
@@ -70,20 +72,27 @@ class DetectionEvent:
 # Human body detection threshold (Lower than 37°C due to distance/clothing)
 HUMAN_TEMP_THRESHOLD_C = 28.0 
 
+# Scene range that 0-255 intensity maps onto (matches waveshare_thermal's min_temp/max_temp)
+SCENE_MIN_TEMP_C = 15.0
+SCENE_MAX_TEMP_C = 45.0
+
 # ============ TEMPERATURE HELPER ============
 
-def intensity_to_temperature(intensity: float, min_temp: float = 15.0, max_temp: float = 45.0) -> float:
+def intensity_to_temperature(intensity: float, min_temp: float = SCENE_MIN_TEMP_C, max_temp: float = SCENE_MAX_TEMP_C) -> float:
     """Map 0-255 pixel intensity to estimated temperature."""
     normalized = intensity / 255.0
     return min_temp + normalized * (max_temp - min_temp)
 
-def temperature_to_intensity(temp: float, min_temp: float = 15.0, max_temp: float = 45.0) -> int:
+def temperature_to_intensity(temp: float, min_temp: float = SCENE_MIN_TEMP_C, max_temp: float = SCENE_MAX_TEMP_C) -> int:
     """Convert temperature to pixel intensity."""
     normalized = (temp - min_temp) / (max_temp - min_temp)
-    return int(np.clip(normalized * 255, 0, 255))
+    return int(min(255.0, max(0.0, normalized * 255)))
 
 HUMAN_TEMP_INTENSITY = temperature_to_intensity(HUMAN_TEMP_THRESHOLD_C)
 
+# Default-range temperature for each 8-bit intensity
+INTENSITY_TO_TEMPERATURE = tuple(intensity_to_temperature(i) for i in range(256))
+
 
 # ============ FRAME SOURCES ============
 
@@ -172,17 +181,29 @@ class ThermalDetector:
         self.min_area = min_area
         # Kernel for morphological opening (removes small noise)
         self.morph_kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3))
+        # Reused by process() until the frame shape changes
+        self._blur_buf = None
+        self._binary_buf = None
+        self._opened_buf = None
+    
+    def _ensure_buffers(self, frame: np.ndarray):
+        if self._blur_buf is None or self._blur_buf.shape != frame.shape:
+            self._blur_buf = np.empty(frame.shape, dtype=np.uint8)
+            self._binary_buf = np.empty(frame.shape, dtype=np.uint8)
+            self._opened_buf = np.empty(frame.shape, dtype=np.uint8)
         
     def process(self, frame: np.ndarray) -> Tuple[List[Hotspot], np.ndarray]:
-        """Process frame -> detections."""
+        """Process frame -> detections. The returned binary image is reused by the next call."""
+        self._ensure_buffers(frame)
         
         # 1. Gaussian Blur (Reduce high-freq noise)
-        blurred = cv2.GaussianBlur(frame, (5, 5), 0)
+        blurred = cv2.GaussianBlur(frame, (5, 5), 0, dst=self._blur_buf)
         
         # 2. Adaptive Thresholding
         # Dynamic offset based on scene statistics
-        mean_val = np.mean(blurred)
-        std_val = np.std(blurred)
+        mean_arr, std_arr = cv2.meanStdDev(blurred)
+        mean_val = float(mean_arr[0, 0])
+        std_val = float(std_arr[0, 0])
         
         # Threshold = Mean + 2.5 * StdDev (Isolates significant heat sources)
         # Clamp to avoid thresholding too low if scene is flat
@@ -190,41 +211,41 @@ class ThermalDetector:
         thresh_val = max(thresh_val, HUMAN_TEMP_INTENSITY) # Respect detection floor
         thresh_val = min(thresh_val, 240) # Allow very hot saturation
         
-        _, binary = cv2.threshold(blurred, thresh_val, 255, cv2.THRESH_BINARY)
+        _, binary = cv2.threshold(blurred, thresh_val, 255, cv2.THRESH_BINARY, dst=self._binary_buf)
         
         # 3. Morphological Cleanup (Opening = Erode -> Dilate)
         # Removes small speckles, keeps solid blobs
-        binary = cv2.morphologyEx(binary, cv2.MORPH_OPEN, self.morph_kernel, iterations=1)
+        binary = cv2.morphologyEx(binary, cv2.MORPH_OPEN, self.morph_kernel, dst=self._opened_buf, iterations=1)
         
-        # 4. Contour Detection
+        # 4. Contour Detection (opening left no hot pixels -> no hotspots)
+        if cv2.countNonZero(binary) == 0:
+            return [], binary
         contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         
         hotspots = []
         for cnt in contours:
-            area = cv2.contourArea(cnt)
-            
-            # Filter 1: Minimum Area
-            if area < self.min_area:
-                continue
-                
-            # Filter 2: Bounding Box
+            # Filter 1: Bounding Box (w*h caps the contour's area)
             x, y, w, h = cv2.boundingRect(cnt)
+            if w * h < self.min_area:
+                continue
             aspect_ratio = float(w) / h
             
-            # Filter 3: Aspect Ratio sanity check
+            # Filter 2: Aspect Ratio sanity check
             # Humans are usually taller than wide (AR < 1.0) or squat (AR < 2.5 if lying down)
             # Eliminate extremely thin lines (noise lines)
             if aspect_ratio > 4.0 or aspect_ratio < 0.2:
                 continue
             
+            # Filter 3: Minimum Area
+            area = cv2.contourArea(cnt)
+            if area < self.min_area:
+                continue
+            
             # Get max intensity stats
-            mask = np.zeros(frame.shape, dtype=np.uint8)
-            cv2.drawContours(mask, [cnt], -1, 255, -1)
-            # Fast numpy masking
             roi_vals = frame[y:y+h, x:x+w]
-            max_val = np.max(roi_vals) if roi_vals.size > 0 else 0
+            max_val = int(roi_vals.max()) if roi_vals.size > 0 else 0
             
-            estimated_temp = intensity_to_temperature(max_val)
+            estimated_temp = INTENSITY_TO_TEMPERATURE[max_val]
             
             # --- CONFIDENCE SCORING ---
             # Score = (Temp / Max) * 0.5 + (Area / Ideal) * 0.3 + (Shape) * 0.2
@@ -254,13 +275,14 @@ class ThermalDetector:
             ))
             
         # Sort by confidence
-        hotspots.sort(key=lambda h: h.confidence, reverse=True)
+        hotspots.sort(key=attrgetter('confidence'), reverse=True)
         return hotspots, binary
 
 
 # ============ MAIN PIPELINE ============
 
 from centroid_tracker import CentroidTracker
+from camera import mjpeg_part
 
 class ThermalFramePipeline:
     """
@@ -333,7 +355,7 @@ class ThermalFramePipeline:
                 for i, h in enumerate(raw_hotspots):
                     if i in used_hotspots: continue
                     cx, cy = h.x + h.width//2, h.y + h.height//2
-                    dist = np.sqrt((cx - centroid[0])**2 + (cy - centroid[1])**2)
+                    dist = math.hypot(cx - centroid[0], cy - centroid[1])
                     
                     if dist < 50 and dist < min_dist: # Association threshold
                         min_dist = dist
@@ -509,15 +531,11 @@ async def generate_mjpeg_stream(pipeline: ThermalFramePipeline, fps: float = 8):
         if frame is not None:
             # JPEG 80 = sweet spot for thermal clarity without huge lag
             _, jpeg = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 80])
-            last_jpeg = jpeg
+            # Frame once per new image; repeats re-send the same bytes object
+            last_jpeg = mjpeg_part(jpeg)
         
         if last_jpeg is not None:
-            yield (
-                b'--frame\r\n'
-                b'Content-Type: image/jpeg\r\n\r\n' + 
-                last_jpeg.tobytes() + 
-                b'\r\n'
-            )
+            yield last_jpeg
         
         # Maintain target FPS
         elapsed = time.time() - start
@@ -169,11 +169,13 @@ export const DetectionProvider: React.FC<{ children: React.ReactNode }> = ({ chi
 
                 ws.onmessage = (event) => {
                     try {
-                        const alert = JSON.parse(event.data);
-                        console.log('[WS] Received alert:', alert);
+                        const data = JSON.parse(event.data);
+                        // Server batches every hotspot from one frame into a single message
+                        const batch: any[] = data.type === 'alerts_batch' ? data.alerts : [data];
+                        console.log('[WS] Received alerts:', batch);
+                        if (batch.length === 0) return;
 
-                        // Add new alert immediately
-                        const newAlert: DetectionEvent = {
+                        const newAlerts: DetectionEvent[] = batch.map((alert) => ({
                             id: alert.id,
                             type: (alert.type || 'LIFE').toUpperCase() as any,
                             confidence: alert.confidence || 0.8,
@@ -183,19 +185,19 @@ export const DetectionProvider: React.FC<{ children: React.ReactNode }> = ({ chi
                             timestamp: new Date(alert.timestamp).toLocaleTimeString([], { hour12: false }),
                             fullTimestamp: new Date(alert.timestamp),
                             isActive: true
-                        };
+                        }));
 
                         setAlerts(prev => {
                             // Avoid duplicates
-                            if (prev.find(a => a.id === newAlert.id)) {
-                                return prev;
-                            }
-                            return [newAlert, ...prev];
+                            const fresh = newAlerts.filter(n => !prev.some(a => a.id === n.id));
+                            return fresh.length ? [...fresh, ...prev] : prev;
                         });
 
                         // Show toast notification
-                        toast.success(`🔥 ${alert.type} Detected!`, {
-                            description: `${Math.round(alert.estimated_temp || 0)}°C | ${Math.round((alert.confidence || 0) * 100)}% confidence`
+                        batch.forEach((alert) => {
+                            toast.success(`🔥 ${alert.type} Detected!`, {
+                                description: `${Math.round(alert.estimated_temp || 0)}°C | ${Math.round((alert.confidence || 0) * 100)}% confidence`
+                            });
                         });
                     } catch (e) {
                         console.error('[WS] Parse error:', e);